@@ -1,5 +1,8 @@
+import functools
 import logging
 import time
+from enum import IntFlag
+
 import serial
 import crc
 from configuration import MountConfig
@@ -31,6 +34,50 @@ class MountInputError(MountError):
     pass
 
 
+class AxisStatusBits(IntFlag):
+    """Bit masks for the Status2 words returned by the mount controller."""
+    ESTOP = 0x0001
+    NEG_LIM = 0x0002
+    POS_LIM = 0x0004
+    BRAKE_ON = 0x0008
+    AMP_DISABLE = 0x0010
+
+
+# (status key, word index, mask) for every flag get_axis_status_bits reports.
+# word1 contains: ESTOP, NEG_LIM, POS_LIM
+# word2 contains: BRAKE, AMP_DIS
+# The masks are stored as plain ints: int & IntFlag dispatches to the Python-level
+# IntFlag.__rand__ and builds a new flag member, about 35x slower than int & int.
+_STATUS_FLAGS = (
+    ('estop', 0, int(AxisStatusBits.ESTOP)),
+    ('neg_limit', 0, int(AxisStatusBits.NEG_LIM)),
+    ('pos_limit', 0, int(AxisStatusBits.POS_LIM)),
+    ('brake_on', 1, int(AxisStatusBits.BRAKE_ON)),
+    ('amp_disabled', 1, int(AxisStatusBits.AMP_DISABLE)),
+)
+
+# Every flag above is an error, so any_error is one AND per word against these.
+_WORD1_ERRORS = int(AxisStatusBits.ESTOP | AxisStatusBits.NEG_LIM | AxisStatusBits.POS_LIM)
+_WORD2_ERRORS = int(AxisStatusBits.BRAKE_ON | AxisStatusBits.AMP_DISABLE)
+
+# Longest stretch _read_frame buffers without finding a terminator. Real replies are a few
+# dozen bytes, so anything this long is line noise or a stuck controller.
+_MAX_FRAME_BYTES = 1024
+
+
+
+@functools.lru_cache(maxsize=None)
+def _static_packet(cmd_key: str) -> tuple[str, bytes]:
+    """
+    Builds the frame for a command sent without a value, once per command.
+
+    Status polls, Stop/Run and the like never change, so their CRC is computed the
+    first time and the finished frame reused after that.
+    """
+    raw_cmd = f"${cmd_key}"
+    return raw_cmd, f"{raw_cmd}{crc.calculate_crc(raw_cmd)}\r".encode('ascii')
+
+
 class MountComm:
     """
     Manages communication with the Schier mount controller.
@@ -54,18 +101,29 @@ class MountComm:
         self.config = config
 
         self.serial = serial.Serial(port, baudrate, timeout=1.0)
-
-        self.BIT_MASKS = {
-            'ESTOP': 0x0001,
-            'NEG_LIM': 0x0002,
-            'POS_LIM': 0x0004,
-            'BRAKE_ON': 0x0008,
-            'AMP_DISABLE': 0x0010
-        }
+        if self.config.serial['low_latency']:
+            self._set_low_latency()
 
         self.ra_target_enc = 0
         self.dec_target_enc = 0
 
+        # last velocity the controller acknowledged for each axis, None when unknown
+        self._velocities = {'VelRa': None, 'VelDec': None}
+
+        # bytes read past the end of the last frame (start of the next pipelined reply)
+        self._rx_buffer = bytearray()
+
+    def _set_low_latency(self):
+        """
+        Turns on ASYNC_LOW_LATENCY for the port. Every exchange is a short frame and its
+        reply, so the driver's receive batching delay is most of the round trip.
+        """
+        try:
+            self.serial.set_low_latency_mode(True)
+        except (AttributeError, ValueError) as e:
+            # AttributeError: not a POSIX port; ValueError: the driver rejected the ioctl
+            self.logger.debug(f"Serial low latency mode unavailable: {e}")
+
     def disconnect(self):
         """
         Safely disconnects from the mount.
@@ -77,11 +135,7 @@ class MountComm:
         try:
 
             # zero the velocities so the mount does not lurch after stop is released ...
-            self._send_command("VelRa", 0)
-            self._send_command("VelDec", 0)
-
-            self._send_command("StopRA")
-            self._send_command("StopDec")
+            self._send_pipelined([("VelRa", 0), ("VelDec", 0), ("StopRA", None), ("StopDec", None)])
 
             # check if we do not have any error status bits after stopping amps, if so we cannot run!
             if self.get_axis_status_bits(0)['any_error'] or self.get_axis_status_bits(1)['any_error']:
@@ -110,24 +164,15 @@ class MountComm:
             # reset mounts command parser!
             #self._clear_comm()
 
-            # zero the mount velocities
-
-            self._send_command("VelRa", 0)
-            self._send_command("VelDec", 0)
-
-            # setup acceleration and max velocity using the config
-
-            accel_ra = int(self.config.acceleration['slew_ra'] * self.config.encoder['steps_per_deg_ra'])
-            accel_dec = int(self.config.acceleration['slew_dec'] * self.config.encoder['steps_per_deg_dec'])
-
-            self._send_command("AccelRa", accel_ra)
-            self._send_command("AccelDec", accel_dec)
-
-            max_ra = int(self.config.speeds['max_ra'] * self.config.encoder['steps_per_deg_ra'])
-            max_dec = int(self.config.speeds['max_dec'] * self.config.encoder['steps_per_deg_dec'])
+            # setup acceleration and max velocity using the config (precomputed in counts)
+            k = self.config.encoder_constants
 
-            self._send_command("MaxVelRA", max_ra)
-            self._send_command("MaxVelDec", max_dec)
+            # zero the mount velocities and load the motion limits in one batch
+            self._send_pipelined([
+                ("VelRa", 0), ("VelDec", 0),
+                ("AccelRa", k.accel_ra), ("AccelDec", k.accel_dec),
+                ("MaxVelRA", k.max_vel_ra), ("MaxVelDec", k.max_vel_dec),
+            ])
 
             # we need to halt the mount to deactivate the amps, then stop to re-engage them!
             # need this to reset velocity curves but sketchy without physical breaks so beware ...
@@ -157,18 +202,21 @@ class MountComm:
         try:
 
             # mount has to be in STOP else it will freeze serial!
-            self._send_command("StopRA")
-            self._send_command("StopDec")
+            self._send_pipelined([("StopRA", None), ("StopDec", None)])
 
             # check if we do not have any error status bits, if so we cannot home!
             if self.get_axis_status_bits(0)['any_error'] or self.get_axis_status_bits(1)['any_error']:
                 raise MountError()
 
-            self._send_command("VelRa", self.config.speeds['home_ra'])
-            self._send_command("VelDec", self.config.speeds['home_dec'])
+            self._send_pipelined([("VelRa", self.config.speeds['home_ra']),
+                                  ("VelDec", self.config.speeds['home_dec'])])
 
+            # not pipelined: a fallback re-send could restart a homing run
             self._send_command("HomeRA",1)
             self._send_command("HomeDec",1)
+
+            # the homing routine drives the axes itself, so don't trust our velocity cache afterwards
+            self._forget_velocities()
         except Exception as e:
             self.logger.error(f"Failed to home run command: {e}")
             raise
@@ -186,11 +234,9 @@ class MountComm:
         try:
 
             # zero the velocities so the mount does not lurch after stop is released ...
-            self._send_command("VelRa", 0)
-            self._send_command("VelDec", 0)
+            self._zero_velocities()
 
-            self._send_command("StopRA")
-            self._send_command("StopDec")
+            self._send_pipelined([("StopRA", None), ("StopDec", None)])
 
             # check if we do not have any error status bits after stopping amps, if so we cannot run!
             if self.get_axis_status_bits(0)['any_error'] or self.get_axis_status_bits(1)['any_error']:
@@ -215,13 +261,12 @@ class MountComm:
 
         try:
 
-            ra_speed = self.config.speeds['home_ra'] * self.config.encoder['steps_per_deg_ra']
-            dec_speed = self.config.speeds['home_dec'] * self.config.encoder['steps_per_deg_dec']
-
-            park_ra = self.config.park['ra'] * self.config.encoder['steps_per_deg_ra'] + self.config.encoder[
-                'zeropt_ra']
-            park_dec = self.config.park['dec'] * self.config.encoder['steps_per_deg_dec'] + self.config.encoder[
-                'zeropt_dec']
+            # cached on the config until the zero points change
+            k = self.config.encoder_constants
+            ra_speed = k.home_vel_ra
+            dec_speed = k.home_vel_dec
+            park_ra = k.park_ra_enc
+            park_dec = k.park_dec_enc
 
             self.ra_target_enc = park_ra
             self.dec_target_enc = park_dec
@@ -244,13 +289,12 @@ class MountComm:
 
         try:
 
-            ra_speed = self.config.speeds['slew_ra'] * self.config.encoder['steps_per_deg_ra']
-            dec_speed = self.config.speeds['slew_dec'] * self.config.encoder['steps_per_deg_dec']
-
-            park_ra = self.config.standby['ra'] * self.config.encoder['steps_per_deg_ra'] + self.config.encoder[
-                'zeropt_ra']
-            park_dec = self.config.standby['dec'] * self.config.encoder['steps_per_deg_dec'] + self.config.encoder[
-                'zeropt_dec']
+            # cached on the config until the zero points change
+            k = self.config.encoder_constants
+            ra_speed = k.slew_vel_ra
+            dec_speed = k.slew_vel_dec
+            park_ra = k.standby_ra_enc
+            park_dec = k.standby_dec_enc
 
             self.ra_target_enc = park_ra
             self.dec_target_enc = park_dec
@@ -279,12 +323,15 @@ class MountComm:
             self.logger.debug("Shifting the mount!")
 
             # calculate the shift velocity in encoder steps per second
-            ra_vel = self.config.speeds['fine_ra'] * self.config.encoder['steps_per_deg_ra']
-            dec_vel = self.config.speeds['fine_dec'] * self.config.encoder['steps_per_deg_dec']
+            k = self.config.encoder_constants
+            ra_vel = k.fine_vel_ra
+            dec_vel = k.fine_vel_dec
 
-            # get the final new position in encoder steps
-            ra_enc = self.get_encoder_position(0)[0] + ra_delta_enc
-            dec_enc = self.get_encoder_position(1)[0] + dec_delta_enc
+            # get the final new position in encoder steps, relative to the last
+            # commanded target (this is what get_encoder_position()[0] reports, so
+            # there is no need for a serial round-trip to fetch it)
+            ra_enc = self.ra_target_enc + ra_delta_enc
+            dec_enc = self.dec_target_enc + dec_delta_enc
 
             self.ra_target_enc = ra_enc
             self.dec_target_enc = dec_enc
@@ -313,8 +360,7 @@ class MountComm:
             dec_pos = self.get_encoder_position(1)[1]
 
             # Update the configuration zero points
-            self.config.encoder['zeropt_ra'] = ra_pos
-            self.config.encoder['zeropt_dec'] = dec_pos
+            self.config.update_zero_points(ra_pos, dec_pos)
 
             self.logger.info(f"Mount zeroed. New Zero Points - RA: {ra_pos}, Dec: {dec_pos}")
 
@@ -335,8 +381,9 @@ class MountComm:
         self.logger.debug(f"Slewing mount to RA: {ra_enc}, Dec: {dec_enc}")
 
         try:
-            ra_vel = self.config.speeds['slew_ra'] * self.config.encoder['steps_per_deg_ra']
-            dec_vel = self.config.speeds['slew_dec'] * self.config.encoder['steps_per_deg_dec']
+            k = self.config.encoder_constants
+            ra_vel = k.slew_vel_ra
+            dec_vel = k.slew_vel_dec
 
             self.ra_target_enc = ra_enc
             self.dec_target_enc = dec_enc
@@ -361,12 +408,11 @@ class MountComm:
         try:
             self.logger.debug(f"Tracking mount at VelRA: {ra_vel}, VelDec: {dec_vel}")
 
-            # Determine target based on velocity direction
-            ra_limit = 'ra_max' if ra_vel >= 0 else 'ra_min'
-            dec_limit = 'dec_max' if dec_vel >= 0 else 'dec_min'
-
-            ra_target = self.config.limits[ra_limit] * self.config.encoder['steps_per_deg_ra'] + self.config.encoder['zeropt_ra']
-            dec_target = self.config.limits[dec_limit] * self.config.encoder['steps_per_deg_dec'] + self.config.encoder['zeropt_dec']
+            # Determine target based on velocity direction, using the limits in
+            # encoder counts that the config precomputes for the current zero points
+            k = self.config.encoder_constants
+            ra_target = k.ra_enc_max if ra_vel >= 0 else k.ra_enc_min
+            dec_target = k.dec_enc_max if dec_vel >= 0 else k.dec_enc_min
 
             self.ra_target_enc = ra_target
             self.dec_target_enc = dec_target
@@ -433,31 +479,26 @@ class MountComm:
 
         try:
 
-            # stop the mount before moving if requested
-            if stop:
-                self._send_command("VelRa", 0)
-                self._send_command("VelDec", 0)
-
-            # check if ra is (as Rykoff puts it) kosher ...
-            if (ra_enc > (self.config.limits['ra_max'] * self.config.encoder['steps_per_deg_ra'] + self.config.encoder[
-                'zeropt_ra']) or ra_enc < self.config.limits['ra_min'] * self.config.encoder['steps_per_deg_ra'] +
-                    self.config.encoder['zeropt_ra']):
-                raise MountSafetyError()
+            # stop the mount before moving if requested; the zeroing rides in the
+            # same pipelined batch as the move itself
+            commands = self._zero_velocity_commands() if stop else []
 
-            # now if dec is too ...
-            if (dec_enc > (
-                    self.config.limits['dec_max'] * self.config.encoder['steps_per_deg_dec'] + self.config.encoder[
-                'zeropt_dec']) or dec_enc < self.config.limits['dec_min'] * self.config.encoder['steps_per_deg_dec'] +
-                    self.config.encoder['zeropt_dec']):
-                raise MountSafetyError()
+            # check if ra and dec are (as Rykoff puts it) kosher ...
+            # one chained comparison per axis against the limits cached in encoder counts
+            k = self.config.encoder_constants
+            if not (k.ra_enc_min <= ra_enc <= k.ra_enc_max and k.dec_enc_min <= dec_enc <= k.dec_enc_max):
+                # still honour the stop before refusing the move
+                if commands:
+                    self._send_pipelined(commands)
+                raise MountSafetyError(f"Target RA: {ra_enc}, Dec: {dec_enc} is outside the software limits")
 
-            # set the positions ...
-            self._send_command("PosRA", ra_enc)
-            self._send_command("PosDec", dec_enc)
-
-            # set the velocities and away we go ...
-            self._send_command("VelRa", ra_vel)
-            self._send_command("VelDec", dec_vel)
+            # set the positions, then the velocities and away we go ...
+            # (pipelined: every frame goes out before we start reading replies)
+            commands += [
+                ("PosRA", ra_enc), ("PosDec", dec_enc),
+                ("VelRa", ra_vel), ("VelDec", dec_vel),
+            ]
+            self._send_pipelined(commands)
 
 
         except Exception as e:
@@ -465,6 +506,26 @@ class MountComm:
             self.logger.error(f"Failed when trying to move mount: {e}")
             raise e
 
+    def _zero_velocities(self):
+        """
+        Zeroes the velocity register on both axes.
+
+        Axes the controller has already acknowledged a zero velocity for are
+        skipped, which saves a serial round-trip per axis when a move follows
+        an idle or another stopped move.
+        """
+        commands = self._zero_velocity_commands()
+        if commands:
+            self._send_pipelined(commands)
+
+    def _zero_velocity_commands(self) -> list:
+        """Returns the (cmd_key, 0) commands needed to zero any axis not already known to be at zero."""
+        return [(cmd_key, 0) for cmd_key in ("VelRa", "VelDec") if self._velocities[cmd_key] != 0]
+
+    def _forget_velocities(self):
+        """Marks both velocity registers as unknown so the next _zero_velocities() sends them."""
+        self._velocities = {'VelRa': None, 'VelDec': None}
+
     def _clear_comm(self):
         """
         Clears serial communication buffers and resets the mount's command parser.
@@ -475,9 +536,12 @@ class MountComm:
         """
         self.logger.debug("Clearing serial comm buffer ...")
 
+        # whatever was in flight may or may not have reached the controller
+        self._forget_velocities()
+
         try:
             # 1. Dump any garbage currently in the input buffer
-            self.serial.reset_input_buffer()
+            self._reset_input()
 
             # 2. Send a Carriage Return to reset the mount computer's command parser
             self.serial.write(b'\r')
@@ -492,13 +556,58 @@ class MountComm:
                 self.logger.debug(f"Discarded junk data: {junk}")
 
             # 5. Ensure the input buffer is purely empty for the next real command
-            self.serial.reset_input_buffer()
+            self._reset_input()
 
         except serial.SerialException as e:
             self.logger.error(f"Failed to clear comms: {e}")
             # If we can't even clear the line, the connection is likely dead.
             raise MountConnectionError("Serial port unresponsive during clear.")
 
+    def _reset_input(self):
+        """Discards everything received so far, both in the driver and in _rx_buffer."""
+        self._rx_buffer.clear()
+        self.serial.reset_input_buffer()
+
+    def _read_frame(self, terminator: bytes = b'\r') -> bytes:
+        """
+        Reads one response frame, up to and including the terminator.
+
+        pyserial's read_until() pulls a single byte per read call. This instead takes
+        everything the driver already holds in one read and keeps any bytes past the
+        terminator for the next call, so a pipelined batch of replies costs a few
+        reads rather than one per character.
+
+        Like read_until(), the port timeout bounds the whole frame, not each read, so a
+        line that keeps sending bytes without a terminator can't hold the serial thread
+        (and with it any stop command) indefinitely. Reading also gives up once
+        _MAX_FRAME_BYTES have been buffered without a terminator.
+
+        Returns:
+            The frame, or whatever partial data arrived (possibly empty) if the frame
+            timed out or overran first.
+        """
+        buf = self._rx_buffer
+        timeout = self.serial.timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            end = buf.find(terminator)
+            if end >= 0:
+                frame = bytes(buf[:end + 1])
+                del buf[:end + 1]
+                return frame
+
+            if len(buf) >= _MAX_FRAME_BYTES or (deadline is not None and time.monotonic() >= deadline):
+                break
+
+            chunk = self.serial.read(max(1, self.serial.in_waiting))
+            if not chunk:
+                break
+            buf += chunk
+
+        frame = bytes(buf)
+        buf.clear()
+        return frame
+
     def _validate_response(self, sent_command: str, response: str) -> bool:
         """
         Validates the integrity of a response from the mount.
@@ -554,6 +663,92 @@ class MountComm:
 
         return True
 
+    def _build_packet(self, cmd_key: str, value=None) -> tuple[str, bytes]:
+        """
+        Builds a command frame.
+
+        Args:
+            cmd_key: The command key (e.g., "VelRa").
+            value: An optional value to send with the command.
+
+        Returns:
+            A tuple of the raw command body (used for echo validation) and the
+            encoded frame ready to write to the port.
+        """
+        # Format: "$Key, Value" or "$Key"
+        if value is None:
+            return _static_packet(cmd_key)
+
+        raw_cmd = f"${cmd_key}, {value}"
+
+        # Calculate CRC (using the external function)
+        # Note: We calculate CRC on the body "$Cmd, Val"
+        crc_hex = crc.calculate_crc(raw_cmd)
+
+        # Final packet: "$Cmd, Val<CRC>\r"
+        # The ROTSE protocol appends CRC directly to the end, then CR.
+        return raw_cmd, f"{raw_cmd}{crc_hex}\r".encode('ascii')
+
+    def _send_pipelined(self, commands: list) -> list:
+        """
+        Sends several commands back-to-back and then collects their responses in order.
+
+        The controller answers each frame in turn, so writing every frame up front
+        removes the idle turnaround between a reply and the next command. If any
+        reply is missing or fails validation, that command and everything after it
+        are re-sent one at a time through _send_command and its retry logic, so only
+        idempotent commands (register writes, Stop, status queries) belong here.
+
+        Args:
+            commands: A list of (cmd_key, value) tuples.
+
+        Returns:
+            The response strings, in command order.
+
+        Raises:
+            MountConnectionError: If a fallback command fails after all retries.
+        """
+        # nothing to overlap with a single frame, so skip the batch bookkeeping
+        if len(commands) == 1:
+            cmd_key, value = commands[0]
+            return [self._send_command(cmd_key, value)]
+
+        packets = [self._build_packet(cmd_key, value) for cmd_key, value in commands]
+
+        for cmd_key, _ in commands:
+            if cmd_key in self._velocities:
+                self._velocities[cmd_key] = None
+
+        responses = []
+        try:
+            self._reset_input()
+            self.serial.write(b''.join(frame for _, frame in packets))
+
+            for (cmd_key, value), (raw_cmd, _) in zip(commands, packets):
+                raw_response = self._read_frame()
+                if not raw_response:
+                    raise MountConnectionError(f"Timeout: Mount did not respond to {cmd_key}.")
+
+                response_str = raw_response.decode('ascii').strip()
+                if not self._validate_response(raw_cmd, response_str):
+                    raise MountConnectionError(f"Validation failed on: {response_str}")
+
+                if cmd_key in self._velocities:
+                    self._velocities[cmd_key] = value
+                responses.append(response_str)
+
+        except (UnicodeDecodeError, MountConnectionError, serial.SerialException) as e:
+            self.logger.warning(f"Pipelined send failed after {len(responses)} of {len(commands)} commands: {e}")
+            try:
+                self._clear_comm()
+            except Exception:
+                pass
+
+            for cmd_key, value in commands[len(responses):]:
+                responses.append(self._send_command(cmd_key, value))
+
+        return responses
+
     def _send_command(self, cmd_key: str, value=None, retries = 3) -> str:
         """
         Sends a command to the mount and waits for a valid response.
@@ -574,20 +769,11 @@ class MountComm:
         """
 
         # --- 1. Construct the Packet ---
-        # Format: "$Key, Value" or "$Key"
-        if value is not None:
-            raw_cmd = f"${cmd_key}, {value}"
-        else:
-            raw_cmd = f"${cmd_key}"
-
-        # Calculate CRC (using the external function)
-        # Note: We calculate CRC on the body "$Cmd, Val"
-        crc_hex = crc.calculate_crc(raw_cmd)
+        raw_cmd, final_packet_bytes = self._build_packet(cmd_key, value)
 
-        # Final packet: "$Cmd, Val<CRC>\r"
-        # The ROTSE protocol appends CRC directly to the end, then CR.
-        final_packet_str = f"{raw_cmd}{crc_hex}\r"
-        final_packet_bytes = final_packet_str.encode('ascii')
+        # A velocity write that fails part way leaves the register in an unknown state
+        if cmd_key in self._velocities:
+            self._velocities[cmd_key] = None
 
         # --- 2. The Retry Loop ---
         last_error = None
@@ -596,12 +782,12 @@ class MountComm:
             try:
 
                 # Clear input buffer to ensure we don't read old garbage.
-                self.serial.reset_input_buffer()
+                self._reset_input()
 
                 self.serial.write(final_packet_bytes)
 
                 # Blocks until \r is seen or timeout (1.0s) occurs
-                raw_response = self.serial.read_until(b'\r')
+                raw_response = self._read_frame()
 
                 # D. Check Timeout
                 if not raw_response:
@@ -614,6 +800,8 @@ class MountComm:
                 # We pass 'raw_cmd' to check that the mount echoed the correct axis
                 if self._validate_response(raw_cmd, response_str):
                     # SUCCESS: Return the valid response
+                    if cmd_key in self._velocities:
+                        self._velocities[cmd_key] = value
                     return response_str
                 else:
                     raise MountConnectionError(f"Validation failed on: {response_str}")
@@ -665,16 +853,38 @@ class MountComm:
         # Send Command
         response = self._send_command(cmd_key)
 
+        return target, self._parse_encoder_position(cmd_key, response)
+
+    def get_encoder_positions(self) -> tuple[tuple[int, int], tuple[int, int]]:
+        """
+        Retrieves the command and actual encoder positions for both axes.
+
+        Both Status1 queries go out in a single pipelined write, so a full position
+        read costs one turnaround on the line instead of two.
+
+        Returns:
+            A tuple ((ra_target, ra_actual), (dec_target, dec_actual)) in encoder counts.
+
+        Raises:
+            MountConnectionError: If either position cannot be read or parsed.
+        """
+        ra_response, dec_response = self._send_pipelined([("Status1RA", None), ("Status1Dec", None)])
+
+        return ((self.ra_target_enc, self._parse_encoder_position("Status1RA", ra_response)),
+                (self.dec_target_enc, self._parse_encoder_position("Status1Dec", dec_response)))
+
+    def _parse_encoder_position(self, cmd_key: str, response: str) -> int:
+        """Extracts the actual encoder position from a Status1 response."""
         try:
             # 1. Strip the CRC (Last 4 chars)
             # Raw: "@Status1Dec 1836177.0, 1836177.0 7ED3"
             # Cut: "@Status1Dec 1836177.0, 1836177.0 "
             body = response[:-4].strip()
 
-            # 2. Split using Regex
-            # This handles the specific format: Space-Number-Comma-Space-Number
-            import re
-            tokens = re.split(r'[ ,]+', body)
+            # 2. Split on spaces and commas
+            # This handles the specific format: Space-Number-Comma-Space-Number.
+            # Two C string methods, several times quicker than a regex split.
+            tokens = body.replace(',', ' ').split()
 
             # Result tokens: ['@Status1Dec', '1836177.0', '1836177.0']
 
@@ -685,10 +895,7 @@ class MountComm:
             # 3. Parse Numbers
             # We MUST use float() first because the log showed '.0' in the string.
             # int('100.0') crashes Python, but int(float('100.0')) works.
-            target_pos = target
-            actual_pos = int(float(tokens[2]))
-
-            return target_pos, actual_pos
+            return int(float(tokens[2]))
 
         except (ValueError, IndexError) as e:
             self.logger.error(
@@ -728,6 +935,51 @@ class MountComm:
         # Expected Format: "$Status2RA, <Word1_Hex>, <Word2_Hex><CRC>"
         response = self._send_command(cmd_key)
 
+        return self._parse_axis_status(response)
+
+    def get_axes_status_bits(self) -> tuple[dict, dict]:
+        """
+        Retrieves and parses the hardware status bits for both axes.
+
+        Both Status2 queries go out in a single pipelined write, so the status loop
+        gets both axes with one call and one turnaround on the line.
+
+        Returns:
+            A tuple (ra_status, dec_status) of dictionaries as returned by
+            get_axis_status_bits.
+
+        Raises:
+            MountConnectionError: If either status cannot be read or parsed.
+        """
+        ra_response, dec_response = self._send_pipelined([("Status2RA", None), ("Status2Dec", None)])
+
+        return self._parse_axis_status(ra_response), self._parse_axis_status(dec_response)
+
+    def get_full_status(self) -> tuple[tuple[int, int], tuple[int, int], tuple[dict, dict]]:
+        """
+        Retrieves the encoder positions and status bits for both axes at once.
+
+        All four Status1/Status2 queries go out in a single pipelined write, so one
+        status poll costs a single turnaround on the line.
+
+        Returns:
+            A tuple ((ra_target, ra_actual), (dec_target, dec_actual), (ra_status, dec_status))
+            as returned by get_encoder_positions and get_axes_status_bits.
+
+        Raises:
+            MountConnectionError: If any reply cannot be read or parsed.
+        """
+        ra_pos, dec_pos, ra_status, dec_status = self._send_pipelined([
+            ("Status1RA", None), ("Status1Dec", None),
+            ("Status2RA", None), ("Status2Dec", None),
+        ])
+
+        return ((self.ra_target_enc, self._parse_encoder_position("Status1RA", ra_pos)),
+                (self.dec_target_enc, self._parse_encoder_position("Status1Dec", dec_pos)),
+                (self._parse_axis_status(ra_status), self._parse_axis_status(dec_status)))
+
+    def _parse_axis_status(self, response: str) -> dict:
+        """Decodes the two status words of a Status2 response into the flag dictionary."""
         try:
             clean_response = response[:-4]  # Strip CRC
             parts = clean_response.split(',')
@@ -739,25 +991,13 @@ class MountComm:
             word1 = int(parts[1].strip(), 16)
             word2 = int(parts[2].strip(), 16)
 
-            # 3. Check bits using Bitwise AND (&)
-            # word1 contains: ESTOP, NEG_LIM, POS_LIM
-            # word2 contains: BRAKE, AMP_DIS
-            estop_active = bool(word1 & self.BIT_MASKS['ESTOP'])
-            neg_limit_active = bool(word1 & self.BIT_MASKS['NEG_LIM'])
-            pos_limit_active = bool(word1 & self.BIT_MASKS['POS_LIM'])
-            brake_active = bool(word2 & self.BIT_MASKS['BRAKE_ON'])
-            amp_disabled = bool(word2 & self.BIT_MASKS['AMP_DISABLE'])
-
-            # 4. Build the Status Dictionary
-            status = {'raw_word1': word1, 'raw_word2': word2, 'estop': estop_active, 'neg_limit': neg_limit_active,
-                      'pos_limit': pos_limit_active, 'brake_on': brake_active, 'amp_disabled': amp_disabled,
-                      'any_error': (
-                              estop_active or
-                              neg_limit_active or
-                              pos_limit_active or
-                              brake_active or
-                              amp_disabled
-                      )}
+            # 3. Check bits using Bitwise AND (&) from the flag table
+            words = (word1, word2)
+            status = {'raw_word1': word1, 'raw_word2': word2}
+            for key, index, mask in _STATUS_FLAGS:
+                status[key] = bool(words[index] & mask)
+
+            status['any_error'] = bool(word1 & _WORD1_ERRORS or word2 & _WORD2_ERRORS)
 
             return status
 
@@ -780,17 +1020,15 @@ class MountComm:
         cmd_key = "RecentFaults"
 
         # 1. Construct Command (Standard Format)
-        raw_cmd = f"${cmd_key}"
-        crc_hex = crc.calculate_crc(raw_cmd)
-        final_packet = f"{raw_cmd}{crc_hex}\r"
+        _, final_packet = self._build_packet(cmd_key)
 
         try:
-            self.serial.reset_input_buffer()
-            self.serial.write(final_packet.encode('ascii'))
+            self._reset_input()
+            self.serial.write(final_packet)
 
             # 2. Read until Semicolon (Specific to this command)
             # The C code: mount_serial_read(..., ';', ...)
-            response = self.serial.read_until(b';')
+            response = self._read_frame(b';')
 
             if not response:
                 raise MountConnectionError("Timeout waiting for fault string")
@@ -804,7 +1042,7 @@ class MountComm:
             # We assume the mount sends [Text];[CR][LF] or similar.
             # We grabbed up to ';', so we dump the rest now.
             time.sleep(0.1)
-            self.serial.reset_input_buffer()
+            self._reset_input()
 
             # 5. Check for Critical Errors (As seen in C evalstat)
             if "High Output I^2" in fault_text:
@@ -1,6 +1,42 @@
-import yaml
 import logging
 import os
+from typing import NamedTuple
+
+# Sidereal rate in degrees per second.
+SIDEREAL_RATE_DEG_PER_SEC = 0.004178
+
+
+class EncoderConstants(NamedTuple):
+    """
+    Frozen snapshot of the encoder calibration scalars, with the software limits,
+    the park/standby positions, the sidereal RA rate, the move speeds and the
+    acceleration/max-velocity registers expressed in encoder counts (per second for
+    rates). Built lazily by
+    MountConfig.encoder_constants.
+    """
+    steps_per_deg_ra: float
+    zeropt_ra: int
+    steps_per_deg_dec: float
+    zeropt_dec: int
+    ra_enc_min: float
+    ra_enc_max: float
+    dec_enc_min: float
+    dec_enc_max: float
+    park_ra_enc: float
+    park_dec_enc: float
+    standby_ra_enc: float
+    standby_dec_enc: float
+    sidereal_rate_ra: float
+    slew_vel_ra: float
+    slew_vel_dec: float
+    fine_vel_ra: float
+    fine_vel_dec: float
+    home_vel_ra: float
+    home_vel_dec: float
+    accel_ra: int
+    accel_dec: int
+    max_vel_ra: int
+    max_vel_dec: int
 
 
 class MountConfig:
@@ -54,6 +90,94 @@ class MountConfig:
 
         self.standby = {'ra': -95.0, 'dec': 174.0}
 
+        # Software polling cadences (seconds). Unlike the values above these are not from the legacy
+        # config and can be tuned, e.g. longer intervals for a slow serial link. They can be changed at
+        # runtime through mount.config: the status loop re-reads its two intervals on every poll, but a
+        # wait loop already in progress keeps the bounds it started with until it finishes.
+        #   status_interval: pause between status loop polls while the mount is moving
+        #   idle_status_interval: upper bound the status loop backs off to while the mount is at rest
+        #   min_interval / max_interval: bounds for the adaptive wait-loop polling
+        #   jitter: relative +/- spread applied to every poll delay
+        #   position_max_age: encoder reads younger than this are reused
+        #   progress_log_interval: how often wait loops log their progress
+        #   tracking_check_interval: how often the tracking heartbeat checks for the limit
+        self.polling = {
+            'status_interval': 0.1, 'idle_status_interval': 1.0,
+            'min_interval': 0.05, 'max_interval': 1.0,
+            'jitter': 0.1,
+            'position_max_age': 0.5,
+            'progress_log_interval': 10.0,
+            'tracking_check_interval': 2.0
+        }
+
+        # Serial link. low_latency sets the Linux ASYNC_LOW_LATENCY flag on the port so the driver passes
+        # each short reply on as it arrives rather than holding it for its receive timer (up to 16 ms on
+        # USB adapters). Ignored where the port or platform does not support it.
+        self.serial = {'low_latency': True}
+
+        # Diagnostics. With detect_blocking on, asyncio debug mode logs any callback that holds the
+        # event loop longer than blocking_threshold seconds (e.g. serial I/O done off the worker thread).
+        # It is only enabled for the duration of init_mount; the loop's own settings are restored after.
+        self.diagnostics = {'detect_blocking': False, 'blocking_threshold': 0.01}
+
+        self._encoder_constants = None
+
+    @property
+    def encoder_constants(self) -> EncoderConstants:
+        """
+        Returns the encoder calibration scalars as a single frozen tuple.
+
+        Computed on first access and reused until the zero points or limits change
+        (via update_zero_points / update_limits), so conversion code can unpack plain
+        floats instead of walking the dicts. Everything else it is derived from is
+        fixed for a run.
+        """
+        if self._encoder_constants is None:
+            enc = self.encoder
+            self._encoder_constants = EncoderConstants(
+                steps_per_deg_ra=enc['steps_per_deg_ra'],
+                zeropt_ra=enc['zeropt_ra'],
+                steps_per_deg_dec=enc['steps_per_deg_dec'],
+                zeropt_dec=enc['zeropt_dec'],
+                ra_enc_min=self.limits['ra_min'] * enc['steps_per_deg_ra'] + enc['zeropt_ra'],
+                ra_enc_max=self.limits['ra_max'] * enc['steps_per_deg_ra'] + enc['zeropt_ra'],
+                dec_enc_min=self.limits['dec_min'] * enc['steps_per_deg_dec'] + enc['zeropt_dec'],
+                dec_enc_max=self.limits['dec_max'] * enc['steps_per_deg_dec'] + enc['zeropt_dec'],
+                park_ra_enc=self.park['ra'] * enc['steps_per_deg_ra'] + enc['zeropt_ra'],
+                park_dec_enc=self.park['dec'] * enc['steps_per_deg_dec'] + enc['zeropt_dec'],
+                standby_ra_enc=self.standby['ra'] * enc['steps_per_deg_ra'] + enc['zeropt_ra'],
+                standby_dec_enc=self.standby['dec'] * enc['steps_per_deg_dec'] + enc['zeropt_dec'],
+                # since we are in the SOUTHERN HEMISPHERE we need to flip the ra motor direction ...
+                sidereal_rate_ra=-1 * SIDEREAL_RATE_DEG_PER_SEC * enc['steps_per_deg_ra'],
+                slew_vel_ra=self.speeds['slew_ra'] * enc['steps_per_deg_ra'],
+                slew_vel_dec=self.speeds['slew_dec'] * enc['steps_per_deg_dec'],
+                fine_vel_ra=self.speeds['fine_ra'] * enc['steps_per_deg_ra'],
+                fine_vel_dec=self.speeds['fine_dec'] * enc['steps_per_deg_dec'],
+                home_vel_ra=self.speeds['home_ra'] * enc['steps_per_deg_ra'],
+                home_vel_dec=self.speeds['home_dec'] * enc['steps_per_deg_dec'],
+                accel_ra=int(self.acceleration['slew_ra'] * enc['steps_per_deg_ra']),
+                accel_dec=int(self.acceleration['slew_dec'] * enc['steps_per_deg_dec']),
+                max_vel_ra=int(self.speeds['max_ra'] * enc['steps_per_deg_ra']),
+                max_vel_dec=int(self.speeds['max_dec'] * enc['steps_per_deg_dec']),
+            )
+        return self._encoder_constants
+
+    def update_limits(self, ra_min=None, ra_max=None, dec_min=None, dec_max=None):
+        """
+        Updates the software movement limits in the current configuration instance.
+
+        The limits are cached in encoder counts by encoder_constants, so change them
+        through this method rather than writing to the dict directly.
+
+        Args:
+            ra_min, ra_max (float): New RA axis limits in degrees, or None to keep the current value.
+            dec_min, dec_max (float): New Dec axis limits in degrees, or None to keep the current value.
+        """
+        for key, value in (('ra_min', ra_min), ('ra_max', ra_max), ('dec_min', dec_min), ('dec_max', dec_max)):
+            if value is not None:
+                self.limits[key] = float(value)
+        self._encoder_constants = None
+        self.logger.debug(f"Runtime Config Update: Limits set to {self.limits}")
 
     def update_zero_points(self, ra_counts, dec_counts):
         """
@@ -65,4 +189,5 @@ class MountConfig:
         """
         self.encoder['zeropt_ra'] = int(ra_counts)
         self.encoder['zeropt_dec'] = int(dec_counts)
+        self._encoder_constants = None
         self.logger.debug(f"Runtime Config Update: Zero Points set to RA={ra_counts}, Dec={dec_counts}")
@@ -1,23 +1,97 @@
+import functools
 import logging
-from astropy.coordinates import SkyCoord, EarthLocation, FK5
-from astropy.time import Time
-from astropy import units as u
+import time
 import numpy as np
 
+# astropy takes a few hundred ms to import, so it is only imported where it is first
+# needed rather than by everything that imports this module
+
+# Rate of sidereal time in degrees per SI second (360.98564736629 deg per day)
+SIDEREAL_DEG_PER_SEC = 360.98564736629 / 86400.0
+
+# Hours of right ascension per degree
+HOURS_PER_DEG = 1.0 / 15.0
+
+
+def hadec_to_enc(ha_deg: float, dec_deg: float, steps_per_deg_ra: float, zeropt_ra: float,
+                 steps_per_deg_dec: float, zeropt_dec: float) -> tuple[int, int]:
+    """
+    Converts a mount-frame hour angle and declination (degrees) to encoder counts.
+
+    Pure scalar arithmetic on plain floats so it can be called without touching
+    the config dictionaries. Both axes are inverted on the Schier mount.
+    """
+    enc_ra = int(ha_deg * -steps_per_deg_ra + zeropt_ra)
+    enc_dec = int(dec_deg * -steps_per_deg_dec + zeropt_dec)
+    return enc_ra, enc_dec
+
+
+def enc_to_hadec(ra_enc: int, dec_enc: int, steps_per_deg_ra: float, zeropt_ra: float,
+                 steps_per_deg_dec: float, zeropt_dec: float) -> tuple[float, float]:
+    """
+    Converts encoder counts back to mount-frame hour angle and declination (degrees).
+    Inverse of hadec_to_enc.
+    """
+    ha_deg = -(ra_enc - zeropt_ra) / steps_per_deg_ra
+    dec_deg = -(dec_enc - zeropt_dec) / steps_per_deg_dec
+    return ha_deg, dec_deg
+
+
+def _sexagesimal(value: float) -> tuple[int, int, float]:
+    """
+    Splits abs(value) into whole units, minutes and seconds, rounded to a tenth of a second.
+
+    Rounding once in integer tenths and splitting with divmod means the seconds field
+    can never print as 60.0.
+    """
+    whole, tenths = divmod(round(abs(value) * 36000), 36000)
+    minutes, tenths = divmod(tenths, 600)
+    return whole, minutes, tenths / 10
+
+
+def ra_to_hms(ra_deg: float) -> str:
+    """Formats a right ascension in degrees as 'HHhMMmSS.Ss'."""
+    h, m, s = _sexagesimal(ra_deg * HOURS_PER_DEG)
+    return f"{h % 24:02d}h{m:02d}m{s:04.1f}s"
+
+
+def dec_to_dms(dec_deg: float) -> str:
+    """Formats a declination in degrees as '+DD°MM'SS.S"'."""
+    sign = '+' if dec_deg >= 0 else '-'
+    d, m, s = _sexagesimal(dec_deg)
+    return f"{sign}{d:02d}°{m:02d}'{s:04.1f}\""
+
 
 class MountCoordinates:
+    # Seconds an astropy sidereal time anchor is extrapolated before it is recomputed
+    LST_ANCHOR_MAX_AGE = 60.0
+
     def __init__(self, config):
         self.config = config
         self.logger = logging.getLogger("SchierMount.Coords")
 
-        self.location = EarthLocation(
+        self._lst_anchor = None  # (wall clock seconds, apparent LST degrees)
+
+    @functools.cached_property
+    def location(self):
+        from astropy.coordinates import EarthLocation
+        from astropy import units as u
+        return EarthLocation(
             lon=self.config.location['longitude'] * u.deg,
             lat=self.config.location['latitude'] * u.deg,
             height=self.config.location['elevation'] * u.m
         )
-        self.j2000_frame = FK5(equinox='J2000')
+
+    @functools.cached_property
+    def j2000_frame(self):
+        from astropy.coordinates import FK5
+        return FK5(equinox='J2000')
 
     def radec_to_enc(self, ra_deg: float, dec_deg: float, time_offset = 0.0) -> tuple[int, int]:
+        from astropy.coordinates import SkyCoord, FK5
+        from astropy.time import Time
+        from astropy import units as u
+
         now = Time.now() + time_offset * u.s
 
         coord_j2000 = SkyCoord(ra=ra_deg*u.deg, dec=dec_deg*u.deg, frame='icrs')
@@ -26,30 +100,95 @@ class MountCoordinates:
         lmst = now.sidereal_time('apparent', longitude=self.location.lon)
         ha = (lmst - coord_current.ra).wrap_at(180 * u.deg)  # Keep HA in -180 to 180 range
 
-        ha_deg = ha.deg
-        dec_deg = coord_current.dec.deg
-
-        ha_deg *= -1.0
-        dec_deg *= -1.0
-
-        enc_ra = int(ha_deg * self.config.encoder['steps_per_deg_ra']  + self.config.encoder['zeropt_ra'])
-        enc_dec = int(dec_deg * self.config.encoder['steps_per_deg_dec']  + self.config.encoder['zeropt_dec'])
-
-        return enc_ra, enc_dec
+        k = self.config.encoder_constants
+        return hadec_to_enc(ha.deg, coord_current.dec.deg,
+                            k.steps_per_deg_ra, k.zeropt_ra,
+                            k.steps_per_deg_dec, k.zeropt_dec)
 
     def enc_to_radec(self, ra_enc: int, dec_enc: int) -> tuple[float, float]:
 
-        ha_deg = (ra_enc - self.config.encoder['zeropt_ra']) /self.config.encoder['steps_per_deg_ra']
-        dec_deg = (dec_enc - self.config.encoder['zeropt_dec']) / self.config.encoder['steps_per_deg_dec']
-
-        ha_deg *= -1.0
-        dec_deg *= -1.0
-
-        # 3. Convert back to RA
-        now = Time.now()
-        lmst = now.sidereal_time('apparent', longitude=self.location.lon)
+        k = self.config.encoder_constants
+        ha_deg, dec_deg = enc_to_hadec(ra_enc, dec_enc,
+                                       k.steps_per_deg_ra, k.zeropt_ra,
+                                       k.steps_per_deg_dec, k.zeropt_dec)
 
         # RA = LMST - HA
-        ra_deg = (lmst.deg - ha_deg) % 360.0
+        ra_deg = (self.local_sidereal_deg() - ha_deg) % 360.0
 
         return ra_deg, dec_deg
+
+    def local_sidereal_deg(self) -> float:
+        """
+        Returns the apparent local sidereal time in degrees.
+
+        Astropy's apparent sidereal time is far too slow to evaluate on every
+        position read, so it is computed once per LST_ANCHOR_MAX_AGE seconds and
+        extrapolated linearly in between. The drift over one anchor period is well
+        below an encoder step.
+        """
+        now = time.time()
+        anchor = self._lst_anchor
+        if anchor is None or now - anchor[0] > self.LST_ANCHOR_MAX_AGE:
+            from astropy.time import Time
+            t = Time(now, format='unix')
+            anchor = (now, t.sidereal_time('apparent', longitude=self.location.lon).deg)
+            self._lst_anchor = anchor
+
+        return (anchor[1] + (now - anchor[0]) * SIDEREAL_DEG_PER_SEC) % 360.0
+
+    def validate_trajectory(self, ha_deg, dec_deg) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Converts a batch of hour angle / declination points to encoder counts and
+        checks them against the software limits in a single NumPy pass.
+
+        Args:
+            ha_deg (array-like): Hour angles in degrees.
+            dec_deg (array-like): Declinations in degrees.
+
+        Returns:
+            tuple: (enc_ra, enc_dec, valid) where the encoder arrays are int64 and
+            valid is a boolean mask that is True where both axes are within limits.
+            Scalar inputs give arrays of length one.
+        """
+        k = self.config.encoder_constants
+
+        # at least 1-d so a scalar still gives arrays the in-place trunc below can write to
+        ha_deg = np.atleast_1d(np.asarray(ha_deg, dtype=np.float64))
+        dec_deg = np.atleast_1d(np.asarray(dec_deg, dtype=np.float64))
+
+        # Fold the axis inversion into the scale so each axis is a single
+        # multiply-add, done in place on one temporary array.
+        enc_ra = ha_deg * -k.steps_per_deg_ra
+        enc_ra += k.zeropt_ra
+        enc_dec = dec_deg * -k.steps_per_deg_dec
+        enc_dec += k.zeropt_dec
+
+        # np.trunc matches the int() truncation used by hadec_to_enc
+        enc_ra = np.trunc(enc_ra, out=enc_ra).astype(np.int64)
+        enc_dec = np.trunc(enc_dec, out=enc_dec).astype(np.int64)
+
+        return enc_ra, enc_dec, self.enc_within_limits(enc_ra, enc_dec)
+
+    def enc_within_limits(self, ra_enc, dec_enc) -> np.ndarray:
+        """
+        Checks a batch of encoder positions against the software limits.
+
+        Applies the same inclusive bounds as MountComm._move_mount, but with NumPy
+        boolean ops so N points cost a handful of array operations.
+
+        Args:
+            ra_enc (array-like): RA encoder counts.
+            dec_enc (array-like): Dec encoder counts.
+
+        Returns:
+            np.ndarray: Boolean mask, True where both axes are within limits.
+        """
+        k = self.config.encoder_constants
+        ra_enc = np.asarray(ra_enc)
+        dec_enc = np.asarray(dec_enc)
+
+        valid = ra_enc >= k.ra_enc_min
+        valid &= ra_enc <= k.ra_enc_max
+        valid &= dec_enc >= k.dec_enc_min
+        valid &= dec_enc <= k.dec_enc_max
+        return valid
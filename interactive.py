@@ -1,133 +1,217 @@
 import asyncio
 import sys
 import logging
+import logging.handlers
+import queue
+import threading
 from schier import SchierMount
+from coordinates import ra_to_hms, dec_to_dms
 
-# Setup basic logging to console
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s'
-)
-
-def dec_to_dms(dec):
-    sign = '+' if dec >= 0 else '-'
-    dec = abs(dec)
-    d = int(dec)
-    m_total = (dec - d) * 60
-    m = int(m_total)
-    s = (m_total - m) * 60
-    return f"{sign}{d:02d}°{m:02d}'{s:04.1f}\""
-
-def ra_to_hms(ra):
-    h_total = ra / 15.0
-    h = int(h_total)
-    m_total = (h_total - h) * 60
-    m = int(m_total)
-    s = (m_total - m) * 60
-    return f"{h:02d}h{m:02d}m{s:04.1f}s"
+try:
+    import uvloop  # optional: faster C event loop
+except ImportError:
+    uvloop = None
+
+
+def setup_logging():
+    """
+    Logs to the console from a background listener thread, so a log call on the event
+    loop only enqueues the record. Returns the started listener; stop() it to flush.
+    """
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(message)s'))
+    log_queue = queue.SimpleQueue()
+    # the queue side only merges the message arguments; timestamp and level are added
+    # by the console formatter on the listener thread
+    enqueue = logging.handlers.QueueHandler(log_queue)
+    enqueue.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=logging.INFO, handlers=[enqueue])
+    listener = logging.handlers.QueueListener(log_queue, console)
+    listener.start()
+    return listener
+
+
+# --- Command handlers ---
+# Each handler is called as handler(mount, args) and awaited. Returning True ends the session.
+
+def _no_args(method):
+    """Handler for a command that just calls a SchierMount coroutine method."""
+    async def handler(mount, args):
+        await method(mount)
+    return handler
+
+
+def _two_floats(method, usage):
+    """Handler for a command that passes two float arguments to a SchierMount coroutine method."""
+    async def handler(mount, args):
+        if len(args) == 2:
+            await method(mount, float(args[0]), float(args[1]))
+        else:
+            print(usage)
+    return handler
+
+
+async def _pos(mount, args):
+    # get_ra_dec may refresh the positions, so take the snapshot after it
+    ra, dec = await mount.get_ra_dec()
+    status = mount.get_status()
+    print(f"\n[POS] RA Enc: {status.ra_enc} | DEC Enc: {status.dec_enc}\n"
+          f"[POS] RA: {ra:.4f} ({ra_to_hms(ra)}) | DEC: {dec:.4f} ({dec_to_dms(dec)})\n"
+          f"[STATE] {status.state}\n")
+
+
+async def _get_offsets(mount, args):
+    ra_offset, dec_offset = await mount.get_offsets()
+    print(f"RA Offset: {ra_offset}, Dec Offset: {dec_offset}")
+
+
+async def _get_coords(mount, args):
+    ra, dec = await mount.get_ra_dec()
+    print(f"RA: {ra:.4f} ({ra_to_hms(ra)})\n"
+          f"Dec: {dec:.4f} ({dec_to_dms(dec)})")
+
+
+HELP_TEXT = """
+--- SchierMount Terminal Controller ---
+Commands:
+  init          - Initializes the mount hardware.
+  home          - Homes the mount.
+  park          - Parks the mount.
+  zenith        - Moves the mount to the zenith position.
+  stop          - Stops all mount movement.
+  pos           - Shows the current encoder and RA/Dec positions and state.
+  slew <ra> <dec> - Slews the mount to the given RA and Dec.
+  track         - Starts sidereal tracking.
+  shift <dra> <ddec> - Shifts the mount by a relative amount (not yet supported).
+  track_rate <rar> <decr> - Starts tracking at a custom rate.
+  offset <rao> <deco> - Sets the RA and Dec offsets.
+  get_offsets   - Gets the current RA and Dec offsets.
+  get_coords    - Gets the current RA and Dec.
+  exit          - Stops the mount and exits the program.
+"""
+
+
+async def _help(mount, args):
+    # one write for the whole block rather than a print() per line
+    sys.stdout.write(HELP_TEXT)
+    sys.stdout.flush()
+
+
+async def _exit(mount, args):
+    await mount.stop_mount()
+    await mount.disconnect_mount()
+    return True
+
+
+COMMANDS = {
+    "init": _no_args(SchierMount.init_mount),
+    "home": _no_args(SchierMount.home_mount),
+    "park": _no_args(SchierMount.park_mount),
+    "zenith": _no_args(SchierMount.standby_mount),
+    "stop": _no_args(SchierMount.stop_mount),
+    "pos": _pos,
+    "slew": _two_floats(SchierMount.slew_mount, "Usage: slew <ra_deg> <dec_deg>"),
+    "track": _no_args(SchierMount.track_sidereal),
+    "shift": _two_floats(SchierMount.shift_mount, "Usage: shift <delta_ra> <delta_dec>"),
+    "track_rate": _two_floats(SchierMount.track_non_sidereal, "Usage: track_rate <ra_rate> <dec_rate>"),
+    "offset": _two_floats(SchierMount.update_offsets, "Usage: offset <ra_offset> <dec_offset>"),
+    "get_offsets": _get_offsets,
+    "get_coords": _get_coords,
+    "help": _help,
+    "exit": _exit,
+}
+
+
+_stdin_lines = None  # queue fed by the stdin reader thread, for non-terminal input
+
+
+def _start_stdin_reader(loop):
+    """Starts a daemon thread that feeds stdin lines into an asyncio.Queue; '' marks EOF."""
+    lines = asyncio.Queue()
+
+    def pump():
+        for line in sys.stdin:
+            loop.call_soon_threadsafe(lines.put_nowait, line)
+        loop.call_soon_threadsafe(lines.put_nowait, '')
+
+    threading.Thread(target=pump, name="stdin-reader", daemon=True).start()
+    return lines
+
+
+async def _read_line():
+    """Reads one line from stdin without parking a default-executor thread; '' at EOF."""
+    global _stdin_lines
+    loop = asyncio.get_running_loop()
+    # piped or redirected input may hold several lines in stdin's buffer, which a
+    # readiness wait can't see, so one long-lived thread reads it instead
+    if not sys.stdin.isatty():
+        if _stdin_lines is None:
+            _stdin_lines = _start_stdin_reader(loop)
+        return await _stdin_lines.get()
+
+    # a terminal in canonical mode only turns readable once a whole line is typed
+    # (or on Ctrl-D), so readline() can't block
+    fd = sys.stdin.fileno()
+    line = loop.create_future()
+    loop.add_reader(fd, lambda: line.done() or line.set_result(sys.stdin.readline()))
+    try:
+        return await line
+    finally:
+        loop.remove_reader(fd)
 
 
 async def handle_input(mount):
-    print("\n--- SchierMount Terminal Controller ---")
-    print("Commands: init, home, park, stop, pos, exit, slew, track, shift, track_rate, offset, get_offsets, get_coords, help")
+    print("\n--- SchierMount Terminal Controller ---\n"
+          "Commands: init, home, park, stop, pos, exit, slew, track, shift, track_rate, offset, get_offsets, get_coords, help")
 
     while True:
-        # Standard input reading in a non-blocking way
         print("Command > ", end='', flush=True)
-        line = await asyncio.get_event_loop().run_in_executor(None, sys.stdin.readline)
+        line = await _read_line()
+        at_eof = not line
+        if at_eof:
+            # end of input: shut down as if "exit" had been typed
+            print()
+            line = "exit"
         parts = line.strip().lower().split()
         if not parts:
             continue
         cmd = parts[0]
         args = parts[1:]
 
+        handler = COMMANDS.get(cmd)
+        if handler is None:
+            print(f"Unknown command: {cmd}")
+            continue
 
         try:
-            if cmd == "init":
-                await mount.init_mount()
-            elif cmd == "home":
-                await mount.home_mount()
-            elif cmd == "park":
-                await mount.park_mount()
-            elif cmd == "zenith":
-                await mount.standby_mount()
-            elif cmd == "stop":
-                await mount.stop_mount()
-            elif cmd == "pos":
-                p = mount.current_positions
-                ra, dec = await mount.get_ra_dec()
-                print(f"\n[POS] RA Enc: {p['ra_enc']} | DEC Enc: {p['dec_enc']}")
-                print(f"[POS] RA: {ra:.4f} ({ra_to_hms(ra)}) | DEC: {dec:.4f} ({dec_to_dms(dec)})")
-                print(f"[STATE] {mount.state}\n")
-            elif cmd == "slew":
-                if len(args) == 2:
-                    ra_deg, dec_deg = float(args[0]), float(args[1])
-                    await mount.slew_mount(ra_deg, dec_deg)
-                else:
-                    print("Usage: slew <ra_deg> <dec_deg>")
-            elif cmd == "track":
-                await mount.track_sidereal()
-            elif cmd == "shift":
-                if len(args) == 2:
-                    delta_ra, delta_dec = float(args[0]), float(args[1])
-                    await mount.shift_mount(delta_ra, delta_dec)
-                else:
-                    print("Usage: shift <delta_ra> <delta_dec>")
-            elif cmd == "track_rate":
-                if len(args) == 2:
-                    ra_rate, dec_rate = float(args[0]), float(args[1])
-                    await mount.track_non_sidereal(ra_rate, dec_rate)
-                else:
-                    print("Usage: track_rate <ra_rate> <dec_rate>")
-            elif cmd == "offset":
-                if len(args) == 2:
-                    ra_offset, dec_offset = float(args[0]), float(args[1])
-                    await mount.update_offsets(ra_offset, dec_offset)
-                else:
-                    print("Usage: offset <ra_offset> <dec_offset>")
-            elif cmd == "get_offsets":
-                ra_offset, dec_offset = await mount.get_offsets()
-                print(f"RA Offset: {ra_offset}, Dec Offset: {dec_offset}")
-            elif cmd == "get_coords":
-                ra, dec = await mount.get_ra_dec()
-                print(f"RA: {ra:.4f} ({ra_to_hms(ra)})")
-                print(f"Dec: {dec:.4f} ({dec_to_dms(dec)})")
-            elif cmd == "help":
-                print("\n--- SchierMount Terminal Controller ---")
-                print("Commands:")
-                print("  init          - Initializes the mount hardware.")
-                print("  home          - Homes the mount.")
-                print("  park          - Parks the mount.")
-                print("  zenith        - Moves the mount to the zenith position.")
-                print("  stop          - Stops all mount movement.")
-                print("  pos           - Shows the current encoder and RA/Dec positions and state.")
-                print("  slew <ra> <dec> - Slews the mount to the given RA and Dec.")
-                print("  track         - Starts sidereal tracking.")
-                print("  shift <dra> <ddec> - Shifts the mount by a relative amount.")
-                print("  track_rate <rar> <decr> - Starts tracking at a custom rate.")
-                print("  offset <rao> <deco> - Sets the RA and Dec offsets.")
-                print("  get_offsets   - Gets the current RA and Dec offsets.")
-                print("  get_coords    - Gets the current RA and Dec.")
-                print("  exit          - Stops the mount and exits the program.")
-
-            elif cmd == "exit":
-                await mount.stop_mount()
+            if await handler(mount, args):
                 break
-            else:
-                print(f"Unknown command: {cmd}")
         except Exception as e:
             print(f"Execution Error: {e}")
+        if at_eof:
+            break
 
 
 async def main():
     mount = SchierMount()
     # The status loop is started inside mount.init_mount() in your class
     # but we run the input handler here.
-    await handle_input(mount)
+    try:
+        await handle_input(mount)
+    except asyncio.CancelledError:
+        # Ctrl+C cancels this task; stop the motors rather than leave the mount moving
+        try:
+            await _exit(mount, [])
+        except Exception as e:
+            print(f"Execution Error: {e}")
+        raise
 
 
 if __name__ == "__main__":
+    listener = setup_logging()
     try:
-        asyncio.run(main())
+        (uvloop.run if uvloop else asyncio.run)(main())
     except KeyboardInterrupt:
-        print("\nExiting...")
\ No newline at end of file
+        print("\nExiting...")
+    finally:
+        listener.stop()
@@ -1,6 +1,12 @@
 import asyncio
+import functools
+import inspect
+import itertools
 import logging
 import math
+import random
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import Enum, auto
 
 from comm import MountComm
@@ -19,30 +25,110 @@ class MountState(Enum):
     RECOVERING = auto()
     UNKNOWN = auto()
 
+
+@dataclass(slots=True, frozen=True)
+class MountStatus:
+    """Point-in-time snapshot of the mount returned by SchierMount.get_status()."""
+    state: MountState
+    ra_enc: int
+    dec_enc: int
+    ra_target_enc: int
+    dec_target_enc: int
+    ra_offset_deg: float
+    dec_offset_deg: float
+
+
 class SchierMount():
 
+    # Dispatcher priorities for queued comm calls, lower runs first.
+    COMM_PRIORITY_URGENT = 0
+    COMM_PRIORITY_NORMAL = 1
+
+    # States in which the status loop polls at full rate.
+    MOVING_STATES = frozenset({MountState.SLEWING, MountState.TRACKING, MountState.PARKING,
+                               MountState.HOMING, MountState.RECOVERING})
+
     def __init__(self):
 
         self.logger = logging.getLogger("SchierMount")
 
         self._status_task = None
         self._move_task = None  # Track the active move
+        self._tracking_handle = None  # Pending tracking heartbeat
+        self._tracking_axes = ()  # (enc_key, target_key, |rate|) for each axis moving while tracking
 
-        self.serial_lock = asyncio.Lock()
+        # All serial traffic goes through one dispatcher task draining this queue.
+        # Entries are (priority, sequence, future, func, args, kwargs).
+        self._comm_queue = asyncio.PriorityQueue(maxsize=16)
+        self._comm_sequence = itertools.count()
+        self._comm_worker = None
 
+        # Serial I/O blocks, so it runs on its own thread rather than the shared default
+        # executor, where it would compete with e.g. the interactive stdin reader.
+        self._serial_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="SchierSerial")
+
+        # Replaced wholesale on every read, never mutated in place, so grabbing the
+        # reference once gives a consistent snapshot without any locking.
         self.current_positions = {
             "ra_enc": 0, "ra_target_enc": 0,
             "dec_enc": 0, "dec_target_enc": 0,
         }
+        self._positions_time = None
+        self._positions_task = None
+        self._positions_updated = asyncio.Event()  # set (and replaced) on every read
+
+        # Set on every state change so the status loop drops out of its idle back-off.
+        self._status_wakeup = asyncio.Event()
+
+        # Set (and replaced) on every state change, for wait_for_state().
+        self._state_changed = asyncio.Event()
+        # Rebound (never mutated) on add/remove, so the state setter iterates it without a copy
+        # and a callback that unregisters itself can't disturb the iteration in progress.
+        self._state_callbacks = ()
+        self._callback_batches = set()  # in-flight gathers of async state callbacks
 
         self.ra_offset_deg = 0.0
         self.dec_offset_deg = 0.0
 
         self.config = MountConfig()
-        self.coord = MountCoordinates(config=MountConfig())
+        self.coord = MountCoordinates(config=self.config)
         self.comm = MountComm(config=self.config)
 
-        self.state = MountState.UNKNOWN
+        self._state = MountState.UNKNOWN
+
+    @property
+    def state(self):
+        return self._state
+
+    @state.setter
+    def state(self, value):
+        # Re-asserting the current state (e.g. FAULT on every status poll while a limit
+        # switch is held) is not a change: don't wake waiters or fire callbacks again.
+        if value == self._state:
+            return
+        self._state = value
+        self._status_wakeup.set()
+
+        # wake every wait_for_state() waiter, then hand them a fresh event for the next change
+        self._state_changed.set()
+        self._state_changed = asyncio.Event()
+
+        pending = []
+        for callback in self._state_callbacks:
+            try:
+                result = callback(value)
+            except Exception as e:
+                self.logger.error(f"State callback {callback!r} failed: {e}")
+            else:
+                if inspect.isawaitable(result):
+                    pending.append((callback, result))
+
+        if pending:
+            self._run_async_callbacks(pending)
+
+        # leaving TRACKING for any reason ends the heartbeat straight away
+        if value != MountState.TRACKING:
+            self._cancel_tracking_heartbeat()
 
     async def init_mount(self):
         """
@@ -54,9 +140,23 @@ class SchierMount():
         Raises:
             Exception: If hardware initialization fails.
         """
+        loop = asyncio.get_running_loop()
+        detect_blocking = self.config.diagnostics['detect_blocking']
+        if detect_blocking:
+            # only for the duration of initialization: debug mode slows every callback
+            saved_debug, saved_threshold = loop.get_debug(), loop.slow_callback_duration
+            loop.set_debug(True)
+            loop.slow_callback_duration = self.config.diagnostics['blocking_threshold']
+            self.logger.warning("Event loop blocking detection enabled during initialization.")
+
         try:
             self.logger.info("Initializing mount hardware...")
+
             await self._safe_comm(self.comm.init_mount)
+
+            # Prime the sidereal time anchor so the first position read doesn't pay for it
+            await loop.run_in_executor(None, self.coord.local_sidereal_deg)
+
             self.state = MountState.PARKED
             if self._status_task is None or self._status_task.done():
                 self._status_task = asyncio.create_task(self._status_loop())
@@ -65,6 +165,122 @@ class SchierMount():
             self.state = MountState.UNKNOWN
             self.logger.error(f"Failed to initialize mount: {e}")
             raise
+        finally:
+            if detect_blocking:
+                loop.set_debug(saved_debug)
+                loop.slow_callback_duration = saved_threshold
+
+    def add_state_callback(self, callback):
+        """
+        Registers a callable that is invoked with the new MountState on every state change.
+
+        Args:
+            callback (callable): Called as callback(state). Must not block. If it returns
+                                 an awaitable (e.g. an async def callback), that is run
+                                 alongside the other async callbacks without being awaited
+                                 by the state change.
+        """
+        self._state_callbacks += (callback,)
+
+    def remove_state_callback(self, callback):
+        """Unregisters a callback previously passed to add_state_callback."""
+        callbacks = list(self._state_callbacks)
+        callbacks.remove(callback)  # ValueError if it was never registered
+        self._state_callbacks = tuple(callbacks)
+
+    def _run_async_callbacks(self, pending):
+        """
+        Runs the coroutines returned by async state callbacks concurrently in one gather.
+
+        The state setter never waits on them, and return_exceptions keeps one failing
+        subscriber from cancelling the others.
+        """
+        callbacks = [callback for callback, _ in pending]
+        batch = asyncio.gather(*(coro for _, coro in pending), return_exceptions=True)
+        self._callback_batches.add(batch)
+
+        def _done(future):
+            self._callback_batches.discard(future)
+            if future.cancelled():
+                return
+            for callback, result in zip(callbacks, future.result()):
+                if isinstance(result, Exception):
+                    self.logger.error(f"State callback {callback!r} failed: {result}")
+
+        batch.add_done_callback(_done)
+
+    async def wait_for_state(self, target_state, timeout=None):
+        """
+        Waits until the mount enters the given state.
+
+        Sleeps on a state-change event rather than polling, so it returns as soon as
+        the state is set.
+
+        Args:
+            target_state (MountState): The state to wait for.
+            timeout (float): Maximum time in seconds to wait, or None to wait forever.
+
+        Raises:
+            TimeoutError: If the state is not reached within the timeout.
+        """
+        async def _wait():
+            while self.state != target_state:
+                await self._state_changed.wait()
+
+        try:
+            await asyncio.wait_for(_wait(), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Mount did not reach state {target_state.name} within {timeout}s") from None
+
+    async def wait_for_fresh_positions(self, timeout=None):
+        """
+        Waits until the next encoder read is published to current_positions.
+
+        Lets scripts react to each position update instead of sleeping a fixed time
+        and hoping the data has moved on.
+
+        Args:
+            timeout (float): Maximum time in seconds to wait, or None to wait forever.
+
+        Raises:
+            TimeoutError: If no new read arrives within the timeout.
+        """
+        try:
+            await asyncio.wait_for(self._wait_for_fresh_positions(self.current_positions), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"No position update within {timeout}s") from None
+
+    async def disconnect_mount(self):
+        """
+        Shuts the driver down cleanly.
+
+        This method:
+        1. Cancels the status loop, any in-flight position read and the tracking heartbeat.
+        2. Stops the motors and closes the serial port via the comm layer.
+        3. Cancels the comm dispatcher and releases the serial thread.
+        """
+        self.logger.info("Disconnecting mount...")
+
+        self._cancel_tracking_heartbeat()
+        await self._cancel_task(self._status_task)
+        self._status_task = None
+        # the shared position read is shielded from its waiters, so cancel it explicitly
+        await self._cancel_task(self._positions_task)
+
+        try:
+            await self._safe_comm(self.comm.disconnect)
+        finally:
+            await self._cancel_task(self._comm_worker)
+            self._comm_worker = None
+            self._serial_executor.shutdown(wait=False)
+            self.state = MountState.UNKNOWN
+
+    async def _cancel_task(self, task):
+        """Cancels a background task and waits for it to finish unwinding."""
+        if task is None or task.done():
+            return
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
 
     async def home_mount(self):
         """
@@ -97,7 +313,9 @@ class SchierMount():
             self.state = MountState.IDLE
             self.logger.info("Homing sequence completed successfully.")
         except Exception as e:
-            logging.error(f"Failed to home mount: {e}")
+            self.logger.error(f"Failed to home mount: {e}")
+            self.state = MountState.FAULT
+            raise
         finally:
             self._move_task = None
 
@@ -106,19 +324,22 @@ class SchierMount():
         Immediately stops all mount movement and cancels active movement tasks.
 
         This method:
-        1. Sends an idle command to the hardware to stop motor movement.
-        2. Sets the mount state to IDLE.
-        3. Cancels any running asynchronous movement tasks (e.g., homing or parking).
+        1. Cancels any running asynchronous movement tasks (e.g., homing or parking).
+        2. Sends an idle command to the hardware to stop motor movement.
+        3. Sets the mount state to IDLE.
         """
         self.logger.info("Stopping mount...")
 
-        # 1. Stop the Hardware
-        await self._safe_comm(self.comm.idle_mount)
-        self.state = MountState.IDLE
+        # 1. Stop the Software Task first. Cancelling it withdraws any move it still has
+        # queued for the dispatcher; otherwise that move would be sent right after the
+        # urgent idle and drive the mount while it reports IDLE.
+        move_task = self._move_task
+        if move_task and not move_task.done() and move_task is not asyncio.current_task():
+            move_task.cancel()
 
-        # 2. Stop the Software Task
-        if self._move_task and not self._move_task.done():
-            self._move_task.cancel()
+        # 2. Stop the Hardware
+        await self._urgent_comm(self.comm.idle_mount)
+        self.state = MountState.IDLE
 
     async def park_mount(self):
         """
@@ -149,7 +370,9 @@ class SchierMount():
             self.logger.info("Homing sequence completed successfully.")
 
         except Exception as e:
-            logging.error(f"Failed to park mount: {e}")
+            self.logger.error(f"Failed to park mount: {e}")
+            self.state = MountState.FAULT
+            raise
         finally:
             self._move_task = None
 
@@ -182,7 +405,9 @@ class SchierMount():
             self.logger.info("Mount moved to standby pos.")
 
         except Exception as e:
-            logging.error(f"Failed to move mount: {e}")
+            self.logger.error(f"Failed to move mount: {e}")
+            self.state = MountState.FAULT
+            raise
         finally:
             self._move_task = None
 
@@ -248,17 +473,20 @@ class SchierMount():
         try:
             self.logger.info("Starting sidereal tracking...")
             self.state = MountState.TRACKING
+            self._move_task = asyncio.current_task()
 
-            # since we are in the SOUTHERN HEMISPHERE we need to flip the ra motor direction ...
-            sidereal_rate_steps_per_sec = -1 * 0.004178 * self.config.encoder['steps_per_deg_ra']
+            # precomputed by the config, already flipped for the SOUTHERN HEMISPHERE
+            sidereal_rate_steps_per_sec = self.config.encoder_constants.sidereal_rate_ra
 
-            await self._safe_comm(self.comm.track_mount, sidereal_rate_steps_per_sec, 0.0)
+            await self._begin_tracking(sidereal_rate_steps_per_sec, 0.0)
 
             self.logger.info("Mount is now tracking at sidereal rate.")
         except Exception as e:
             self.state = MountState.FAULT
             self.logger.error(f"Failed to start sidereal tracking: {e}")
             raise
+        finally:
+            self._move_task = None
 
     async def shift_mount(self, delta_ra: float, delta_dec: float):
         """
@@ -278,9 +506,16 @@ class SchierMount():
             5. Waits for the mount to reach the target position.
 
         Raises:
+            NotImplementedError: Always, for now; see below.
             TimeoutError: If the mount fails to reach the target within the timeout.
             Exception: For communication or hardware errors.
         """
+        # The secant correction needs the sky declination, but get_ra_dec() returns the
+        # mount-frame Dec axis angle (0-240 deg, 174 at standby), and there is no mapping
+        # from one to the other yet. Refuse before touching the state or the serial line.
+        raise NotImplementedError(
+            "shift_mount needs a mapping from mount-frame Dec to sky declination, which is not implemented")
+
         try:
             self.state = MountState.SLEWING
             self._move_task = asyncio.current_task()
@@ -305,8 +540,9 @@ class SchierMount():
 
             # 3. Convert degrees to encoder steps
             # We use the corrected RA but the raw Dec
-            ra_steps = int(delta_ra_corrected * self.config.encoder['steps_per_deg_ra'])
-            dec_steps = int(delta_dec * self.config.encoder['steps_per_deg_dec'])
+            k = self.config.encoder_constants
+            ra_steps = int(delta_ra_corrected * k.steps_per_deg_ra)
+            dec_steps = int(delta_dec * k.steps_per_deg_dec)
 
             # 4. Hardware Communication
             await self._safe_comm(self.comm.shift_mount, ra_steps, dec_steps)
@@ -337,6 +573,7 @@ class SchierMount():
         try:
             self.logger.info(f"Starting non-sidereal tracking (RA: {ra_rate}, Dec: {dec_rate})...")
             self.state = MountState.TRACKING
+            self._move_task = asyncio.current_task()
 
             # Limit tracking rate to 2 degrees per second to prevent hardware strain
             MAX_TRACK_RATE = 1.0
@@ -344,16 +581,19 @@ class SchierMount():
                 raise ValueError(f"Tracking rate exceeds maximum limit of {MAX_TRACK_RATE} deg/sec")
 
             # Convert deg/sec to steps/sec
-            ra_steps_per_sec = -1* ra_rate * self.config.encoder['steps_per_deg_ra']
-            dec_steps_per_sec = dec_rate * self.config.encoder['steps_per_deg_dec']
+            k = self.config.encoder_constants
+            ra_steps_per_sec = -1* ra_rate * k.steps_per_deg_ra
+            dec_steps_per_sec = dec_rate * k.steps_per_deg_dec
 
-            await self._safe_comm(self.comm.track_mount, ra_steps_per_sec, dec_steps_per_sec)
+            await self._begin_tracking(ra_steps_per_sec, dec_steps_per_sec)
 
             self.logger.info("Mount is now tracking at non-sidereal rate.")
         except Exception as e:
             self.state = MountState.FAULT
             self.logger.error(f"Failed to start non-sidereal tracking: {e}")
             raise
+        finally:
+            self._move_task = None
 
     async def update_offsets(self, delta_ra_deg :float, delta_dec_deg : float):
         """
@@ -376,6 +616,20 @@ class SchierMount():
         """
         return self.ra_offset_deg, self.dec_offset_deg
 
+    def get_status(self) -> MountStatus:
+        """
+        Returns a snapshot of the mount state, encoder positions and offsets.
+
+        Built straight from the cached values with no serial traffic, so it is cheap
+        enough to call from a UI refresh loop.
+
+        Returns:
+            MountStatus: A new snapshot; later changes to the mount do not affect it.
+        """
+        p = self.current_positions
+        return MountStatus(self._state, p["ra_enc"], p["dec_enc"], p["ra_target_enc"], p["dec_target_enc"],
+                           self.ra_offset_deg, self.dec_offset_deg)
+
     async def get_ra_dec(self):
         """
         Returns the current RA and Dec of the telescope in degrees.
@@ -386,7 +640,9 @@ class SchierMount():
             tuple: (ra_deg, dec_deg) as floats.
         """
 
-        return self.coord.enc_to_radec(self.current_positions['ra_enc'], self.current_positions['dec_enc'])
+        await self._refresh_positions(max_age=self.config.polling['position_max_age'])
+        p = self.current_positions
+        return self.coord.enc_to_radec(p['ra_enc'], p['dec_enc'])
 
     async def _attempt_recovery(self):
         self.logger.info("Attempting servo and mount recovery...")
@@ -409,27 +665,58 @@ class SchierMount():
         Raises:
             TimeoutError: If the mount does not stabilize within the timeout period.
         """
-        start_time = asyncio.get_event_loop().time()
-        stable_start_time = None
+        try:
+            await asyncio.wait_for(self._poll_encoder_stop(tolerance), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError("Mount failed to stop within timeout period.") from None
+
+    async def _poll_encoder_stop(self, tolerance):
+        """Polls until the encoders have stayed within tolerance for 5 seconds. No timeout of its own."""
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        stable_deadline = None  # loop time at which the encoders will have been still for 5s
+
+        # hoist the config lookups out of the loop, they are read once per wait
+        polling = self.config.polling
+        min_interval = polling['min_interval']
+        max_interval = polling['max_interval']
+        log_interval = polling['progress_log_interval']
+        # progress lines are DEBUG only, so skip the schedule entirely when they'd be dropped
+        log_progress = self.logger.isEnabledFor(logging.DEBUG)
+
+        last_snapshot = self.current_positions
+        last_ra, last_dec = last_snapshot["ra_enc"], last_snapshot["dec_enc"]
+
+        # back off while the encoders look stable, drop back to fast polling on movement
+        delay = min_interval
+        next_log_time = start_time + log_interval
+
+        while True:
+            await asyncio.sleep(self._jitter(delay))
 
-        last_ra = self.current_positions["ra_enc"]
-        last_dec = self.current_positions["dec_enc"]
+            # only a fresh read can tell us anything; re-checking the same snapshot would
+            # also let a stalled status loop look like a stationary mount
+            await self._wait_for_fresh_positions(last_snapshot)
+            p = last_snapshot = self.current_positions
 
-        while (asyncio.get_event_loop().time() - start_time) < timeout:
-            curr_ra = self.current_positions["ra_enc"]
-            curr_dec = self.current_positions["dec_enc"]
+            # time the samples by when they were read, not by when this loop got to them
+            curr_ra, curr_dec = p["ra_enc"], p["dec_enc"]
+            now = self._positions_time
 
-            if abs(curr_ra - last_ra) <= tolerance and abs(curr_dec - last_dec) <= tolerance:
-                if stable_start_time is None:
-                    stable_start_time = asyncio.get_event_loop().time()
-                elif (asyncio.get_event_loop().time() - stable_start_time) >= 5.0:
+            if log_progress and now >= next_log_time:
+                self.logger.debug(f"Waiting for encoders to settle... RA: {curr_ra}, Dec: {curr_dec}")
+                next_log_time += log_interval
+
+            if max(abs(curr_ra - last_ra), abs(curr_dec - last_dec)) <= tolerance:
+                if stable_deadline is None:
+                    stable_deadline = now + 5.0
+                elif now >= stable_deadline:
                     return
+                delay = min(delay * 1.5, max_interval)
             else:
-                stable_start_time = None
+                stable_deadline = None
                 last_ra, last_dec = curr_ra, curr_dec
-
-            await asyncio.sleep(0.1)
-        raise TimeoutError("Mount failed to stop within timeout period.")
+                delay = min_interval
 
     async def _await_mount_at_position(self, timeout=180, tolerance=100):
         """
@@ -443,38 +730,275 @@ class SchierMount():
             TimeoutError: If the mount does not reach the target position within the
                           specified timeout period.
         """
-        start_time = asyncio.get_event_loop().time()
+        try:
+            await asyncio.wait_for(self._poll_mount_at_position(tolerance), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Mount failed to reach target position within {timeout}s ") from None
+
+    async def _poll_mount_at_position(self, tolerance):
+        """Polls until both axes are within tolerance of their targets. No timeout of its own."""
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+
+        # fastest either axis can close the gap, so the poll never sleeps past arrival
+        k = self.config.encoder_constants
+        rate = max(k.slew_vel_ra, k.slew_vel_dec)
+
+        # hoist the config lookups out of the loop, they are read once per wait
+        polling = self.config.polling
+        min_interval = polling['min_interval']
+        max_interval = polling['max_interval']
+        log_interval = polling['progress_log_interval']
+        next_log_time = start_time + log_interval
+        log_progress = self.logger.isEnabledFor(logging.DEBUG)
+
+        # the status loop may still publish a read from before the move was commanded,
+        # whose target is the old one; start from a read taken after the command
+        await self._refresh_positions(fresh=True)
+
+        p = self.current_positions
+        while True:
+            ra_diff = abs(p["ra_enc"] - p["ra_target_enc"])
+            dec_diff = abs(p["dec_enc"] - p["dec_target_enc"])
+
+            # one comparison on the worst axis, reused below for the poll delay
+            remaining = max(ra_diff, dec_diff) - tolerance
+            if remaining <= 0:
+                return
+
+            if log_progress and self._positions_time >= next_log_time:
+                self.logger.debug(f"Waiting for target... RA error: {ra_diff}, Dec error: {dec_diff}")
+                next_log_time += log_interval
+
+            delay = min(max(remaining / rate, min_interval), max_interval)
+            await asyncio.sleep(self._jitter(delay))
+
+            # check once per encoder update, never twice against the same read
+            await self._wait_for_fresh_positions(p)
+            p = self.current_positions
+
+    async def _wait_for_fresh_positions(self, snapshot):
+        """Returns once current_positions has been replaced by a newer read than snapshot."""
+        while self.current_positions is snapshot:
+            await self._positions_updated.wait()
+
+    async def _begin_tracking(self, ra_steps_per_sec, dec_steps_per_sec):
+        """
+        Shared tail of the sidereal and non-sidereal tracking starts.
 
-        while (asyncio.get_event_loop().time() - start_time) < timeout:
-            ra_diff = abs(self.current_positions["ra_enc"] - self.current_positions["ra_target_enc"])
-            dec_diff = abs(self.current_positions["dec_enc"] - self.current_positions["dec_target_enc"])
+        Sends the tracking move (one pipelined position/velocity batch in the comm
+        layer) and starts the tracking heartbeat.
+
+        Args:
+            ra_steps_per_sec (float): RA rate in encoder counts per second, already sign-corrected.
+            dec_steps_per_sec (float): Dec rate in encoder counts per second.
+        """
+        await self._safe_comm(self.comm.track_mount, ra_steps_per_sec, dec_steps_per_sec)
+
+        # Only axes that actually move can reach their limit. Binding them once here means
+        # sidereal tracking (Dec rate 0) checks RA alone on every tick.
+        self._tracking_axes = tuple(
+            (enc_key, target_key, abs(rate))
+            for enc_key, target_key, rate in (("ra_enc", "ra_target_enc", ra_steps_per_sec),
+                                              ("dec_enc", "dec_target_enc", dec_steps_per_sec))
+            if rate != 0
+        )
+        self._start_tracking_heartbeat()
+
+    def _start_tracking_heartbeat(self):
+        """Schedules the first tracking check, replacing any heartbeat already pending."""
+        self._cancel_tracking_heartbeat()
+        # full interval first: the positions on hand may still show the pre-tracking target
+        self._tracking_handle = asyncio.get_running_loop().call_later(
+            self.config.polling['tracking_check_interval'], self._tracking_tick)
+
+    def _tracking_check_delay(self, time_to_limit):
+        """
+        Time until the next tracking check, scaled to how soon an axis reaches its limit.
+
+        Checks a quarter of the way through the shortest time-to-limit, clamped between
+        the minimum poll interval and the configured tracking check interval, so the
+        heartbeat tightens up only as the mount nears the end of its travel.
+        """
+        polling = self.config.polling
+        return max(polling['min_interval'], min(polling['tracking_check_interval'], time_to_limit * 0.25))
 
-            if ra_diff <= tolerance and dec_diff <= tolerance:
+    def _cancel_tracking_heartbeat(self):
+        if self._tracking_handle is not None:
+            self._tracking_handle.cancel()
+            self._tracking_handle = None
+
+    def _tracking_tick(self):
+        """
+        Periodic check while tracking, driven by loop.call_later instead of a sleeping task.
+
+        Tracking moves run towards the software limit, so an axis arriving at its target
+        means the mount has stopped tracking. Any state change away from TRACKING cancels
+        the pending tick through the state setter, so no periodic exit check is needed.
+        """
+        self._tracking_handle = None
+
+        tolerance = self.config.encoder['tolerance']
+        p = self.current_positions
+
+        time_to_limit = math.inf
+        for enc_key, target_key, rate in self._tracking_axes:
+            remaining = abs(p[enc_key] - p[target_key])
+            if remaining <= tolerance:
+                self.logger.warning("Tracking reached the software limit, mount is no longer tracking.")
+                self.state = MountState.IDLE
                 return
+            time_to_limit = min(time_to_limit, remaining / rate)
 
-            await asyncio.sleep(0.2)
+        self._tracking_handle = asyncio.get_running_loop().call_later(
+            self._tracking_check_delay(time_to_limit), self._tracking_tick)
 
-        raise TimeoutError(f"Mount failed to reach target position within {timeout}s ")
+    def _jitter(self, delay):
+        """Spreads a poll delay by +/- the configured jitter so wait loops don't lock step with the status loop."""
+        jitter = self.config.polling['jitter']
+        return delay * (1.0 + random.uniform(-jitter, jitter))
 
     async def _safe_comm(self, func, *args, **kwargs):
-        """Standard lock wrapper to prevent serial collision."""
-        async with self.serial_lock:
-            return await asyncio.to_thread(func, *args, **kwargs)
+        """Queues a comm call for the dispatcher to prevent serial collision and awaits its result."""
+        return await self._enqueue_comm(self.COMM_PRIORITY_NORMAL, func, args, kwargs)
+
+    async def _urgent_comm(self, func, *args, **kwargs):
+        """Like _safe_comm, but jumps ahead of any queued calls (used for stopping the mount)."""
+        return await self._enqueue_comm(self.COMM_PRIORITY_URGENT, func, args, kwargs)
+
+    async def _enqueue_comm(self, priority, func, args, kwargs):
+        if self._comm_worker is None:
+            self._comm_worker = asyncio.create_task(self._comm_dispatcher())
+            self._comm_worker.add_done_callback(self._clear_comm_worker)
+
+        future = asyncio.get_running_loop().create_future()
+        await self._comm_queue.put((priority, next(self._comm_sequence), future, func, args, kwargs))
+        return await future
+
+    def _clear_comm_worker(self, task):
+        # the dispatcher only ends when cancelled; drop it so the next call starts a new one
+        if self._comm_worker is task:
+            self._comm_worker = None
+
+    async def _comm_dispatcher(self):
+        """Runs queued comm calls one at a time on the dedicated serial thread."""
+        loop = asyncio.get_running_loop()
+        while True:
+            _, _, future, func, args, kwargs = await self._comm_queue.get()
+            try:
+                # the caller gave up waiting before we got to it
+                if future.cancelled():
+                    continue
+
+                try:
+                    result = await loop.run_in_executor(self._serial_executor,
+                                                        functools.partial(func, *args, **kwargs))
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+                except Exception as e:
+                    if not future.cancelled():
+                        future.set_exception(e)
+                else:
+                    if not future.cancelled():
+                        future.set_result(result)
+            finally:
+                self._comm_queue.task_done()
+
+    async def _refresh_positions(self, max_age=None, fresh=False):
+        """
+        Reads both encoder positions from the controller into current_positions.
+
+        Concurrent callers share a single in-flight read, so the serial line only
+        sees one pair of Status1 requests however many coroutines ask at once.
+
+        Args:
+            max_age (float): If given, positions read less than this many seconds
+                             ago are reused without touching the serial line.
+            fresh (bool): If True, never reuse a read that was already in flight
+                          when this was called, e.g. one that started before a
+                          move was commanded and so reports the old target.
+        """
+        loop = asyncio.get_running_loop()
+        if max_age is not None and self._positions_time is not None \
+                and (loop.time() - self._positions_time) < max_age:
+            return
+
+        if fresh and self._positions_task is not None and not self._positions_task.done():
+            try:
+                await asyncio.shield(self._positions_task)
+            except Exception:
+                pass  # whatever happened to the old read, we start our own below
+
+        if self._positions_task is None or self._positions_task.done():
+            self._start_positions_read()
+
+        # shield so one cancelled waiter doesn't abort the read for everyone else
+        await asyncio.shield(self._positions_task)
+
+    def _start_positions_read(self, with_status=False):
+        """Starts the shared position read that _refresh_positions callers join."""
+        self._positions_task = asyncio.create_task(self._read_positions(with_status))
+        self._positions_task.add_done_callback(self._clear_positions_task)
+        return self._positions_task
+
+    def _clear_positions_task(self, task):
+        if self._positions_task is task:
+            self._positions_task = None
+
+    async def _read_positions(self, with_status=False):
+        """
+        Reads and publishes both encoder positions.
+
+        With with_status, the Status2 bits for both axes ride along in the same
+        pipelined exchange and are returned as (ra_status, dec_status); otherwise
+        returns None.
+        """
+        if with_status:
+            (ra_target, ra_actual), (dec_target, dec_actual), axes_status = \
+                await self._safe_comm(self.comm.get_full_status)
+        else:
+            (ra_target, ra_actual), (dec_target, dec_actual) = \
+                await self._safe_comm(self.comm.get_encoder_positions)
+            axes_status = None
+
+        self.current_positions = {
+            "ra_enc": ra_actual, "ra_target_enc": ra_target,
+            "dec_enc": dec_actual, "dec_target_enc": dec_target,
+        }
+        self._positions_time = asyncio.get_running_loop().time()
+
+        # wake everything waiting on a fresh read, then hand them a new event for the next one
+        self._positions_updated.set()
+        self._positions_updated = asyncio.Event()
+
+        return axes_status
 
     async def _status_loop(self):
+        """
+        Polls positions and axis status bits.
+
+        Polls at the configured status interval, measured start to start, while the mount
+        is moving. When it is at rest the interval backs off by 1.5x per poll up to the
+        idle interval; any state change wakes the loop and resets it to the fast rate.
+        """
+        loop = asyncio.get_running_loop()
+        delay = self.config.polling['status_interval']
         while True:
+            poll_start = loop.time()
             try:
 
-                ra_target, ra_actual = await self._safe_comm(self.comm.get_encoder_position, 0)
-                dec_target, dec_actual = await self._safe_comm(self.comm.get_encoder_position, 1)
+                # one pipelined Status1+Status2 exchange per poll, published as the shared
+                # position read so any waiters join it rather than queueing their own
+                task = self._positions_task
+                if task is None or task.done():
+                    task = self._start_positions_read(with_status=True)
+                axes_status = await asyncio.shield(task)
 
-                ra_axis_status = await self._safe_comm(self.comm.get_axis_status_bits, 0)
-                dec_axis_status = await self._safe_comm(self.comm.get_axis_status_bits, 1)
-
-                self.current_positions = {
-                    "ra_enc": ra_actual, "ra_target_enc": ra_target,
-                    "dec_enc": dec_actual, "dec_target_enc": dec_target,
-                }
+                # joined a plain position read someone else started: fetch the bits separately
+                if axes_status is None:
+                    axes_status = await self._safe_comm(self.comm.get_axes_status_bits)
+                ra_axis_status, dec_axis_status = axes_status
 
                 if ra_axis_status['any_error'] or dec_axis_status['any_error']:
                     self.state = MountState.FAULT
@@ -482,4 +1006,30 @@ class SchierMount():
             except Exception as e:
                 self.logger.error(f"Status Loop Error: {e}")
 
-            await asyncio.sleep(0.1)
+            # read on every pass so edits to mount.config.polling apply from the next poll
+            polling = self.config.polling
+            fast_interval = polling['status_interval']
+            idle_interval = polling['idle_status_interval']
+
+            if self.state in self.MOVING_STATES:
+                delay = fast_interval
+            else:
+                delay = min(delay * 1.5, idle_interval)
+
+            # the interval runs from the start of this poll, so the poll's own serial time
+            # doesn't stretch the cadence; a poll that overran it goes again straight away
+            timeout = self._jitter(delay) - (loop.time() - poll_start)
+            if self._status_wakeup.is_set():
+                delay = fast_interval
+            elif timeout > 0:
+                # asyncio.timeout rather than wait_for: on 3.11, wait_for returns normally if
+                # the wakeup lands in the same step as a cancel, and this loop would never end
+                try:
+                    async with asyncio.timeout(timeout):
+                        await self._status_wakeup.wait()
+                    delay = fast_interval
+                except TimeoutError:
+                    pass
+            else:
+                await asyncio.sleep(0)
+            self._status_wakeup.clear()
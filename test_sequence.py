@@ -2,32 +2,37 @@ import asyncio
 import logging
 from schier import SchierMount
 
+try:
+    import uvloop  # optional: faster C event loop
+except ImportError:
+    uvloop = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-def dec_to_dms(dec):
-    sign = '+' if dec >= 0 else '-'
-    dec = abs(dec)
-    d = int(dec)
-    m_total = (dec - d) * 60
-    m = int(m_total)
-    s = (m_total - m) * 60
-    return f"{sign}{d:02d}°{m:02d}'{s:04.1f}"
-
-def ra_to_hms(ra):
-    h_total = ra / 15.0
-    h = int(h_total)
-    m_total = (h_total - h) * 60
-    m = int(m_total)
-    s = (m_total - m) * 60
-    return f"{h:02d}h{m:02d}m{s:04.1f}s"
+# formatted by logging only when the record is emitted
+STATUS_LINE = "  [STATUS] State: %s | RA Enc: %s | DEC Enc: %s | RA: %.4f | Dec: %.4f"
+
 
 async def monitor_status(mount):
-    """Continuously prints mount status."""
+    """Prints mount status on position updates, at most once a second."""
+    loop = asyncio.get_running_loop()
+    next_print = loop.time()
     while True:
-        p = mount.current_positions
+        try:
+            await mount.wait_for_fresh_positions(timeout=5.0)
+        except TimeoutError:
+            logging.warning("  [STATUS] No position update in 5s")
+            continue
+
+        now = loop.time()
+        if now < next_print:
+            continue
+        next_print = now + 1.0
+
+        # get_ra_dec may refresh the positions, so take the snapshot after it
         ra, dec = await mount.get_ra_dec()
-        logging.info(f"  [STATUS] State: {mount.state} | RA Enc: {p['ra_enc']} | DEC Enc: {p['dec_enc']} | RA: {ra:.4f} | Dec: {dec:.4f}")
-        await asyncio.sleep(1)
+        status = mount.get_status()
+        logging.info(STATUS_LINE, status.state, status.ra_enc, status.dec_enc, ra, dec)
 
 
 async def run_test_sequence():
@@ -57,6 +62,7 @@ async def run_test_sequence():
         logging.info("Stopping mount to ensure motors are off...")
         await mount.stop_mount()
         logging.info("Mount stopped.")
+        await mount.disconnect_mount()
 
 if __name__ == "__main__":
-    asyncio.run(run_test_sequence())
+    (uvloop.run if uvloop else asyncio.run)(run_test_sequence())
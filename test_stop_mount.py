@@ -0,0 +1,66 @@
+import asyncio
+import threading
+
+import pytest
+
+import schier
+from schier import MountState, SchierMount
+
+
+class FakeComm:
+    """Records the order commands reach the wire; slow() holds the serial thread until released."""
+
+    def __init__(self, config=None):
+        self.wire = []
+        self.release = threading.Event()
+
+    def slow(self):
+        self.release.wait(5)
+        self.wire.append('slow')
+
+    def idle_mount(self):
+        self.wire.append('idle')
+
+    def slew_mount(self, ra_enc, dec_enc):
+        self.wire.append(('slew', ra_enc, dec_enc))
+
+    def track_mount(self, ra_rate, dec_rate):
+        self.wire.append(('track', ra_rate, dec_rate))
+
+
+@pytest.fixture
+def mount(monkeypatch):
+    monkeypatch.setattr(schier, "MountComm", FakeComm)
+    mount = SchierMount()
+    mount.coord.radec_to_enc = lambda ra_deg, dec_deg: (100, 200)
+    yield mount
+    mount._serial_executor.shutdown(wait=False)
+
+
+async def _stop_while_queued(mount, start):
+    """Stops the mount while the move started by start() is queued behind a busy serial thread."""
+    busy = asyncio.create_task(mount._safe_comm(mount.comm.slow))
+    while not mount._comm_queue.empty() or mount._comm_worker is None:
+        await asyncio.sleep(0)
+
+    move = asyncio.create_task(start(mount))
+    while mount._comm_queue.empty():
+        await asyncio.sleep(0)
+
+    stop = asyncio.create_task(mount.stop_mount())
+    await asyncio.sleep(0.01)
+    mount.comm.release.set()
+    await asyncio.gather(busy, stop)
+    await asyncio.gather(move, return_exceptions=True)
+
+
+@pytest.mark.parametrize("start", [
+    lambda mount: mount.slew_mount(10.0, -20.0),
+    lambda mount: mount.track_sidereal(),
+], ids=["slew", "track"])
+def test_stop_withdraws_queued_move(mount, start):
+    asyncio.run(_stop_while_queued(mount, start))
+
+    assert mount.comm.wire == ['slow', 'idle']
+    assert mount.state == MountState.IDLE
+    assert mount._tracking_handle is None